@@ -0,0 +1,64 @@
+"""Optional native-speed password scanner for bulk/audit-sized inputs.
+
+``scan`` fuses the character-class, triple-repeat and ascending-sequence
+checks from ``main`` into one byte loop. The loop is written in the
+subset of Python that numba's nopython mode accepts: when numba is
+installed it is JIT-compiled (``JIT`` is True) and runs at native speed;
+otherwise the plain interpreter version is exported as a fallback.
+
+Note the byte-level predicates are only correct for ASCII input — a
+multi-byte UTF-8 character can hide a real repeat or fabricate one out
+of identical continuation bytes — so ``main`` dispatches here for ASCII
+passwords only and keeps the str paths for everything else.
+"""
+
+_LOWER = b"abcdefghijklmnopqrstuvwxyz"
+_UPPER = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGITS = b"0123456789"
+_SPECIAL = rb"~`!@#$%^&*()-_+={}[]|/\:;`><.?"
+
+# byte -> 4-bit class mask (0x1 lower, 0x2 upper, 0x4 digit, 0x8 special)
+_CLASS_TBL = bytearray(256)
+for _b in _LOWER:
+    _CLASS_TBL[_b] = 0x1
+for _b in _UPPER:
+    _CLASS_TBL[_b] = 0x2
+for _b in _DIGITS:
+    _CLASS_TBL[_b] = 0x4
+for _b in _SPECIAL:
+    _CLASS_TBL[_b] = 0x8
+_CLASS_TBL = bytes(_CLASS_TBL)
+del _b
+
+
+def _scan_py(buf: bytes) -> tuple[int, int, int]:
+    """Return (class_mask, has_repeat, has_seq) for a UTF-8 byte buffer."""
+    acc = 0
+    has_rep = 0
+    has_seq = 0
+    a = -2
+    b = -2
+    for i in range(len(buf)):
+        c = buf[i]
+        acc |= _CLASS_TBL[c]
+        if a == b == c:
+            has_rep = 1
+        elif (
+            c - b == 1
+            and b - a == 1
+            and (0x30 <= a <= 0x37 or 0x61 <= a <= 0x78 or 0x41 <= a <= 0x58)
+        ):
+            has_seq = 1
+        a = b
+        b = c
+    return acc, has_rep, has_seq
+
+
+try:
+    from numba import njit
+except ImportError:
+    JIT = False
+    scan = _scan_py
+else:
+    JIT = True
+    scan = njit(cache=True)(_scan_py)
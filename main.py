@@ -1,90 +1,137 @@
+import re
+import threading
+
 import flet as ft
 
+# Optional JIT-compiled fused scanner (see fastscan.py). Only worth
+# dispatching to when numba actually compiled it and the input is long
+# enough to amortize the encode + call overhead.
+try:
+    from fastscan import JIT as _FASTSCAN_JIT, scan as _fast_scan
+except ImportError:
+    _FASTSCAN_JIT = False
+    _fast_scan = None
+_FAST_SCAN_MIN = 64
+
 # -------- Compatibility shims (handles Colors/colors and Icons/icons) --------
 COLORS = getattr(ft, "colors", None) or getattr(ft, "Colors")
 ICONS = getattr(ft, "icons", None) or getattr(ft, "Icons")
 
-def color_with_opacity(color, opacity: float):
-    fn = getattr(COLORS, "with_opacity", None)
-    if not fn:
+# Probe with_opacity's argument order once at import so the per-call path
+# is a plain function call with no getattr or try/except.
+_WITH_OPACITY = getattr(COLORS, "with_opacity", None)
+if _WITH_OPACITY is None:
+    def color_with_opacity(color, opacity: float):
         return color
+else:
     try:
-        return fn(opacity, color)   # newer signature
+        _WITH_OPACITY(0.5, getattr(COLORS, "WHITE", "white"))  # newer signature?
+        def color_with_opacity(color, opacity: float):
+            return _WITH_OPACITY(opacity, color)
     except TypeError:
-        try:
-            return fn(color, opacity)  # older signature
-        except TypeError:
-            return color
+        def color_with_opacity(color, opacity: float):
+            return _WITH_OPACITY(color, opacity)  # older signature
 # -----------------------------------------------------------------------------
 
-# Stores references to progress bars (CONTROLS) and checkboxes (STATUS)
-CONTROLS: list[ft.Row] = []
-STATUS: list[ft.Row] = []
-
-def store_control(function):
-    """Decorator to collect certain UI controls for later updates."""
-    def wrapper(*args, **kwargs):
-        reference = function(*args, **kwargs)
-        if kwargs.get("control", 0) == 0:
-            CONTROLS.append(reference)
-        else:
-            STATUS.append(reference)
-        return reference
-    return wrapper
-
-
-class PasswordStrengthChecker:
-    def __init__(self, password: str):
-        self.password = password or ""
-
-    def length_check(self) -> int:
-        n = len(self.password)
-        if 0 < n < 8:
-            return 0
-        elif 8 <= n < 12:
-            return 1
-        elif 12 <= n < 16:
-            return 2
-        elif n >= 16:
-            return 3
-        return 0
-
-    def character_check(self) -> int:
-        chars = set(self.password)
-        lower = set("abcdefghijklmnopqrstuvwxyz")
-        upper = set("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
-        digits = set("0123456789")
-        special = set(r"~`!@#$%^&*()-_þʼ«æ…+={}[]|/\:;`><.?")  # raw string avoids \: warning
-
-        score = 0
-        if any(c in lower for c in chars):
-            score += 1
-        if any(c in upper for c in chars):
-            score += 1
-        if any(c in digits for c in chars):
-            score += 1
-        if any(c in special for c in chars):
-            score += 1
-        return {1: 0, 2: 1, 3: 2, 4: 3}.get(score, 0)
-
-    def repeat_check(self) -> int:
-        p = self.password
-        if not p:
-            return 2
-        for i in range(len(p) - 2):
-            if p[i] == p[i + 1] == p[i + 2]:
-                return 0
-        return 1
-
-    def sequential_check(self) -> int:
-        p = self.password
-        if not p:
-            return 2
-        for i in range(len(p) - 2):
-            chunk = p[i: i + 3]
-            if chunk.isdigit() or chunk.islower() or chunk.isupper():
-                return 0
-        return 1
+# Colors/icons used on per-event or per-build paths, resolved through the
+# shim once so call sites do a single global load instead of two
+# attribute lookups.
+_RED, _YELLOW, _GREEN_400, _GREEN_900 = COLORS.RED, COLORS.YELLOW, COLORS.GREEN_400, COLORS.GREEN_900
+_WHITE, _TRANSPARENT, _BLUE = COLORS.WHITE, COLORS.TRANSPARENT, COLORS.BLUE
+_ICON_VISIBILITY = ICONS.VISIBILITY
+_ICON_VISIBILITY_OFF = ICONS.VISIBILITY_OFF
+_ICON_COPY = ICONS.COPY
+_ICON_LOCK = ICONS.LOCK_OUTLINE_ROUNDED
+
+# Character classes for strength checks, built once at import so the
+# per-keystroke path does no set construction.
+_LOWER = "abcdefghijklmnopqrstuvwxyz"
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGITS = "0123456789"
+_SPECIAL = r"~`!@#$%^&*()-_þʼ«æ…+={}[]|/\:;`><.?"  # raw string avoids \: warning
+_SCORE_MAP = (0, 0, 1, 2, 3)  # number of classes present -> score
+
+# Translation table folding every classified character into one of four
+# marker letters; class presence then reduces to a C-level substring test.
+_CLASS_TRANSLATE = str.maketrans(
+    _LOWER + _UPPER + _DIGITS + _SPECIAL,
+    "L" * 26 + "U" * 26 + "D" * 10 + "S" * len(_SPECIAL),
+)
+
+# Compiled once: triple-repeat backreference and every ascending 3-char
+# window (012..789, abc..xyz, ABC..XYZ). One search() each runs the whole
+# scan in the regex engine instead of a Python loop.
+_REPEAT_RE = re.compile(r"(.)\1\1")
+_SEQ_RE = re.compile(
+    "|".join(s[i: i + 3] for s in (_DIGITS, _LOWER, _UPPER) for i in range(len(s) - 2))
+)
+
+# strength -> (bgcolor, width) for the indicator bars, indexed instead of
+# branching through the same if/elif ladder in every *_status method.
+_LEN_STYLE = (
+    (_RED, 40),
+    (_YELLOW, 70),
+    (_GREEN_400, 100),
+    (_GREEN_900, 130),
+)
+_BOOL_STYLE = (
+    (_RED, 65),
+    (_GREEN_900, 130),
+)
+
+def _gap(height: int = 10) -> ft.Container:
+    # vertical spacer: a bare Container skips the line painting a
+    # transparent ft.Divider still does
+    return ft.Container(height=height)
+
+
+def length_check(password: str) -> int:
+    # counting the tier thresholds met replaces the comparison ladder;
+    # empty input stays tier 0 like before
+    n = len(password)
+    return (n >= 8) + (n >= 12) + (n >= 16)
+
+
+def character_check(password: str) -> int:
+    # translate() runs in C; each marker test is then a short memchr.
+    t = password.translate(_CLASS_TRANSLATE)
+    score = ("L" in t) + ("U" in t) + ("D" in t) + ("S" in t)
+    return _SCORE_MAP[score]
+
+
+def _repeat_and_seq(password: str) -> tuple[int, int]:
+    # Both answers come from compiled regex scans.
+    if not password:
+        return (2, 2)
+    return (
+        0 if _REPEAT_RE.search(password) else 1,
+        0 if _SEQ_RE.search(password) else 1,
+    )
+
+
+def repeat_check(password: str) -> int:
+    return _repeat_and_seq(password)[0]
+
+
+def sequential_check(password: str) -> int:
+    return _repeat_and_seq(password)[1]
+
+
+def score_all(password: str) -> tuple[int, int, int, int]:
+    """All four scores in one call, sharing scans between checks.
+
+    Audit-sized inputs go through the JIT'd fused byte loop when numba is
+    available; interactive-sized ones use the C-level str paths.
+    """
+    p = password or ""
+    if _FASTSCAN_JIT and len(p) >= _FAST_SCAN_MIN and p.isascii():
+        # ASCII only: the byte-level repeat/sequence predicates misread
+        # multi-byte encodings, so non-ASCII input keeps the str paths
+        mask, rep, seq = _fast_scan(p.encode())
+        count = (mask & 1) + (mask >> 1 & 1) + (mask >> 2 & 1) + (mask >> 3 & 1)
+        return (length_check(p), _SCORE_MAP[count], 0 if rep else 1, 0 if seq else 1)
+    rep, seq = _repeat_and_seq(p)
+    return (length_check(p), character_check(p), rep, seq)
 
 
 class AppWindow(ft.Card):
@@ -94,18 +141,31 @@ class AppWindow(ft.Card):
         self.show_password = False
         self.password_field: ft.TextField | None = None
         self.page: ft.Page | None = None  # set in main()
-        # build UI
+        # debounce state: coalesce rapid keystrokes into one re-check
+        self._pending_value: str | None = None
+        self._timer: threading.Timer | None = None
+        self._last_scores: tuple[int, int, int, int] | None = None
+        # clipboard API resolved once on first copy (page isn't set yet)
+        self._clip_fn = None
+        # bar/box controls resolved once at build time so update helpers
+        # index straight into them instead of walking .controls chains
+        self._bars: list[ft.Container] = []
+        self._boxes: list[ft.Container] = []
+        # build UI: one Container + one Column for the whole card, so each
+        # page.update() diffs a flat tree instead of nested wrappers
         self.content = ft.Container(
             width=400,
             height=None,  # let it grow to fit the list + input
             border_radius=10,
             bgcolor="#1f262f",
+            padding=10,
+            clip_behavior=ft.ClipBehavior.HARD_EDGE,
             content=ft.Column(
-                spacing=12,  # space between checklist and input
+                spacing=10,
                 horizontal_alignment="center",
                 controls=[
-                    self.password_strength_display(),
-                    ft.Divider(height=4, color="transparent"),
+                    *self.password_strength_display(),
+                    _gap(4),
                     self.password_input_display(),
                 ],
             ),
@@ -113,11 +173,43 @@ class AppWindow(ft.Card):
 
     # --- Password logic handlers -------------------------------------------
     def check_password(self, e: ft.ControlEvent):
-        checker = PasswordStrengthChecker(e.data or "")
-        self.password_length_status(checker.length_check())
-        self.character_check_status(checker.character_check())
-        self.repeat_check_status(checker.repeat_check())
-        self.sequential_check_status(checker.sequential_check())
+        # Trailing-edge debounce: remember the latest value and (re)start a
+        # short timer so a burst of keystrokes produces one re-check.
+        self._pending_value = e.data or ""
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(0.1, self._apply_check)
+        self._timer.start()
+
+    def _reset_all(self):
+        # clearing the field needs no scans: hide every bar and tick
+        if self._last_scores is None:
+            return  # already in the empty state
+        self._last_scores = None
+        for bar in self._bars:
+            bar.width = 0
+            bar.opacity = 0
+        for box in self._boxes:
+            box.content.value = False
+            box.opacity = 0
+        if self.page:
+            self.page.update()
+
+    def _apply_check(self):
+        value = self._pending_value or ""
+        if not value:
+            self._reset_all()
+            return
+        scores = score_all(value)
+        if scores == self._last_scores:
+            return  # strength tier unchanged: nothing to redraw
+        self._last_scores = scores
+        self.password_length_status(scores[0])
+        self.character_check_status(scores[1])
+        self.repeat_check_status(scores[2])
+        self.sequential_check_status(scores[3])
+        if self.page:
+            self.page.update()
 
     def toggle_view(self, e: ft.ControlEvent):
         """Toggle show/hide password and update icon + field."""
@@ -125,23 +217,23 @@ class AppWindow(ft.Card):
         if not self.password_field or not self.page:
             return
         self.password_field.password = not self.show_password
-        # also flip the eye icon
-        e.control.icon = ICONS.VISIBILITY if self.show_password else ICONS.VISIBILITY_OFF
-        e.control.update()
+        # also flip the eye icon; the page update below re-renders it
+        e.control.icon = _ICON_VISIBILITY if self.show_password else _ICON_VISIBILITY_OFF
         self.page.update()
 
     def copy_password(self, e: ft.ControlEvent):
         if not self.password_field or not self.page:
             return
         text = self.password_field.value or ""
-        # clipboard: try both modern and older names
-        set_clip = getattr(self.page, "set_clipboard", None)
-        copy_fn = getattr(self.page, "copy_to_clipboard", None)
+        # clipboard: probe the modern and older names once, then reuse
+        if self._clip_fn is None:
+            self._clip_fn = (
+                getattr(self.page, "set_clipboard", None)
+                or getattr(self.page, "copy_to_clipboard", None)
+                or (lambda _text: None)
+            )
         try:
-            if callable(set_clip):
-                set_clip(text)
-            elif callable(copy_fn):
-                copy_fn(text)
+            self._clip_fn(text)
         except Exception:
             pass
         # show snackbar to confirm copy (reuse the page's snackbar)
@@ -152,7 +244,7 @@ class AppWindow(ft.Card):
                 sb.content.value = "Password copied to clipboard"
             else:
                 sb.content = ft.Text("Password copied to clipboard")
-            sb.bgcolor = getattr(COLORS, "GREEN_400", None) or getattr(COLORS, "GREEN", None)
+            sb.bgcolor = _GREEN_400
             sb.open = True
             self.page.update()
         else:
@@ -163,84 +255,60 @@ class AppWindow(ft.Card):
     # --- UI update helpers -------------------------------------------------
     def criteria_satisfied(self, index: int, status: int):
         # Show/hide checkbox tick with opacity only
-        if index >= len(STATUS):
-            return
-        box = STATUS[index].controls[0]
+        box = self._boxes[index]
         if status == 3:
             box.opacity = 1
             box.content.value = True
         else:
             box.content.value = False
             box.opacity = 0
-        box.update()
 
     def password_length_status(self, strength: int):
-        if not CONTROLS:
-            return
-        bar = CONTROLS[0].controls[1].controls[0]
-        if strength == 0:
-            bar.bgcolor, bar.width = COLORS.RED, 40
-        elif strength == 1:
-            bar.bgcolor, bar.width = COLORS.YELLOW, 70
-        elif strength == 2:
-            bar.bgcolor, bar.width = COLORS.GREEN_400, 100
-        elif strength == 3:
-            bar.bgcolor, bar.width = COLORS.GREEN_900, 130
+        bar = self._bars[0]
+        if 0 <= strength < 4:
+            bar.bgcolor, bar.width = _LEN_STYLE[strength]
         else:
             bar.width = 0
         bar.opacity = 1
-        bar.update()
         self.criteria_satisfied(0, strength)
 
     def character_check_status(self, strength: int):
-        if len(CONTROLS) < 2:
-            return
-        bar = CONTROLS[1].controls[1].controls[0]
-        if strength == 0:
-            bar.bgcolor, bar.width = COLORS.RED, 40
-        elif strength == 1:
-            bar.bgcolor, bar.width = COLORS.YELLOW, 70
-        elif strength == 2:
-            bar.bgcolor, bar.width = COLORS.GREEN_400, 100
-        elif strength == 3:
-            bar.bgcolor, bar.width = COLORS.GREEN_900, 130
+        bar = self._bars[1]
+        if 0 <= strength < 4:
+            bar.bgcolor, bar.width = _LEN_STYLE[strength]
         else:
             bar.width = 0
         bar.opacity = 1
-        bar.update()
         self.criteria_satisfied(1, strength)
 
     def repeat_check_status(self, strength: int):
-        if len(CONTROLS) < 3:
-            return
-        bar = CONTROLS[2].controls[1].controls[0]
-        if strength == 0:
-            bar.bgcolor, bar.width = COLORS.RED, 65
-        elif strength == 1:
-            bar.bgcolor, bar.width = COLORS.GREEN_900, 130
+        bar = self._bars[2]
+        if 0 <= strength < 2:
+            bar.bgcolor, bar.width = _BOOL_STYLE[strength]
         else:
             bar.width = 0
         bar.opacity = 1
-        bar.update()
         self.criteria_satisfied(2, 3 if strength == 1 else strength)
 
     def sequential_check_status(self, strength: int):
-        if len(CONTROLS) < 4:
-            return
-        bar = CONTROLS[3].controls[1].controls[0]
-        if strength == 0:
-            bar.bgcolor, bar.width = COLORS.RED, 65
-        elif strength == 1:
-            bar.bgcolor, bar.width = COLORS.GREEN_900, 130
+        bar = self._bars[3]
+        if 0 <= strength < 2:
+            bar.bgcolor, bar.width = _BOOL_STYLE[strength]
         else:
             bar.width = 0
         bar.opacity = 1
-        bar.update()
         self.criteria_satisfied(3, 3 if strength == 1 else strength)
 
     # ------------------------- UI building blocks -----------------------------
-    @store_control
-    def check_criteria_display(self, criteria: str, description: str, control: int):
+    def check_criteria_display(self, criteria: str, description: str):
+        bar = ft.Container(
+            height=5,
+            width=0,
+            bgcolor=_TRANSPARENT,
+            opacity=0,
+            border_radius=10,
+        )
+        self._bars.append(bar)
         return ft.Row(
             alignment="spaceBetween",
             vertical_alignment="center",
@@ -249,92 +317,66 @@ class AppWindow(ft.Card):
                 ft.Column(
                     spacing=2,
                     controls=[
-                        ft.Text(value=criteria, size=12, weight=ft.FontWeight.BOLD, color=COLORS.WHITE),
+                        ft.Text(value=criteria, size=12, weight=ft.FontWeight.BOLD, color=_WHITE),
                         ft.Text(
                             value=description,
                             size=12,
-                            color=color_with_opacity(COLORS.WHITE, 0.54),
+                            color=color_with_opacity(_WHITE, 0.54),
                         ),
                     ],
                 ),
-                ft.Row(
-                    spacing=0,
-                    alignment="start",
-                    controls=[
-                        ft.Container(
-                            height=5,
-                            width=0,
-                            bgcolor=COLORS.TRANSPARENT,
-                            opacity=0,
-                            border_radius=10,
-                        )
-                    ],
-                ),
+                ft.Row(spacing=0, alignment="start", controls=[bar]),
             ],
         )
 
-    @store_control
-    def check_status_display(self, control: int):
-        return ft.Row(
-            alignment="end",
-            controls=[
-                ft.Container(
-                    opacity=0,             # start hidden
-                    border_radius=50,
-                    width=21,
-                    height=21,
-                    alignment=ft.alignment.center,
-                    content=ft.Checkbox(
-                        scale=0.7,
-                        fill_color="#7df6dd",
-                        check_color=COLORS.BLUE,
-                        disabled=True,
-                    ),
-                ),
-            ],
+    def check_status_display(self):
+        box = ft.Container(
+            opacity=0,             # start hidden
+            border_radius=50,
+            width=21,
+            height=21,
+            alignment=ft.alignment.center,
+            content=ft.Checkbox(
+                scale=0.7,
+                fill_color="#7df6dd",
+                check_color=_BLUE,
+                disabled=True,
+            ),
         )
+        self._boxes.append(box)
+        return ft.Row(alignment="end", controls=[box])
 
     def password_strength_display(self):
-        return ft.Container(
-            width=400,
-            height=None,  # natural height so input isn't pushed out
-            bgcolor="#1f262f",
-            border_radius=10,
-            padding=10,
-            clip_behavior=ft.ClipBehavior.HARD_EDGE,
-            content=ft.Column(
-                horizontal_alignment="center",
-                spacing=10,
-                controls=[
-                    ft.Divider(height=5, color="transparent"),
-                    ft.Text("Password Strength Checker", size=24, color=COLORS.WHITE, weight=ft.FontWeight.BOLD),
-                    ft.Text("Please input your password and check the strength!", size=14, color=COLORS.WHITE),
-                    ft.Divider(height=25, color="transparent"),
+        # returns a flat list of controls; the card's single Column hosts
+        # them directly rather than nesting another Container + Column
+        return [
+            _gap(5),
+            ft.Text("Password Strength Checker", size=24, color=_WHITE, weight=ft.FontWeight.BOLD),
+            ft.Text("Please input your password and check the strength!", size=14, color=_WHITE),
+            _gap(25),
 
-                    self.check_criteria_display("1. Length Check", "Strong passwords are 12+ characters", control=0),
-                    self.check_status_display(control=1),
+            self.check_criteria_display("1. Length Check", "Strong passwords are 12+ characters"),
+            self.check_status_display(),
 
-                    ft.Divider(height=10, color="transparent"),
+            _gap(),
 
-                    self.check_criteria_display(
-                        "2. Character Check", "Checks upper, lower, digits, and specials", control=0
-                    ),
-                    self.check_status_display(control=1),
+            self.check_criteria_display(
+                "2. Character Check", "Checks upper, lower, digits, and specials"
+            ),
+            self.check_status_display(),
 
-                    ft.Divider(height=10, color="transparent"),
+            _gap(),
 
-                    self.check_criteria_display("3. Repeat Checker", "Detects triple repeated characters", control=0),
-                    self.check_status_display(control=1),
+            self.check_criteria_display("3. Repeat Checker", "Detects triple repeated characters"),
+            self.check_status_display(),
 
-                    ft.Divider(height=10, color="transparent"),
+            _gap(),
 
-                    self.check_criteria_display(
-                        "4. Sequential Checker", "Detects simple sequences (abc/ABC/123)", control=0
-                    ),
-                    self.check_status_display(control=1),
-                ],
+            self.check_criteria_display(
+                "4. Sequential Checker", "Detects simple sequences (abc/ABC/123)"
             ),
-        )
+            self.check_status_display(),
+        ]
 
     def password_text_field_display(self):
         # create the TextField once and reuse so handlers can access it
@@ -343,7 +385,7 @@ class AppWindow(ft.Card):
                 spacing=20,
                 vertical_alignment="center",
                 controls=[
-                    ft.Icon(name=ICONS.LOCK_OUTLINE_ROUNDED, size=16, opacity=0.85),
+                    ft.Icon(name=_ICON_LOCK, size=16, opacity=0.85),
                     self.password_field,
                 ],
             )
@@ -355,9 +397,9 @@ class AppWindow(ft.Card):
             width=200,
             text_size=14,
             content_padding=6,
-            cursor_color=COLORS.WHITE,
+            cursor_color=_WHITE,
             cursor_width=1,
-            color=COLORS.WHITE,
+            color=_WHITE,
             hint_text="Type password here...",
             on_change=self.check_password,
             password=True,
@@ -366,14 +408,14 @@ class AppWindow(ft.Card):
             spacing=20,
             vertical_alignment="center",
             controls=[
-                ft.Icon(name=ICONS.LOCK_OUTLINE_ROUNDED, size=16, opacity=0.85),
+                ft.Icon(name=_ICON_LOCK, size=16, opacity=0.85),
                 self.password_field,
             ],
         )
 
     def password_input_display(self):
         # Right side: eye toggle + copy button
-        view_icon_name = ICONS.VISIBILITY if self.show_password else ICONS.VISIBILITY_OFF
+        view_icon_name = _ICON_VISIBILITY if self.show_password else _ICON_VISIBILITY_OFF
         return ft.Card(
             width=350,
             height=60,
@@ -389,7 +431,7 @@ class AppWindow(ft.Card):
                             spacing=6,
                             controls=[
                                 ft.IconButton(icon=view_icon_name, icon_size=20, on_click=self.toggle_view),
-                                ft.IconButton(icon=ICONS.COPY, icon_size=18, on_click=self.copy_password),
+                                ft.IconButton(icon=_ICON_COPY, icon_size=18, on_click=self.copy_password),
                             ],
                         ),
                     ],